@@ -1,5 +1,5 @@
 from langchain_aws import ChatBedrock
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, SystemMessage
 from bedrock_agentcore import BedrockAgentCoreApp
@@ -8,6 +8,14 @@ import random
 import hashlib
 import uuid
 import json
+import concurrent.futures
+import collections
+import re
+import threading
+import logging
+import os
+
+logger = logging.getLogger(__name__)
 
 app = BedrockAgentCoreApp()
 
@@ -16,43 +24,48 @@ app = BedrockAgentCoreApp()
 def get_current_timestamp() -> str:
     """Get the current exact timestamp in ISO format. LLMs cannot know the current time."""
     timestamp = datetime.datetime.now().isoformat()
-    print(f"[TOOL] get_current_timestamp called, returning: {timestamp}")
+    logger.debug("[TOOL] get_current_timestamp called, returning: %s", timestamp)
     return timestamp
 
+# OS-backed randomness to match the "truly random" claim, with randint bound once
+_RANDINT = random.SystemRandom().randint
+
 @tool
 def generate_random_number(min_val: int, max_val: int) -> int:
     """Generate a truly random number between min_val and max_val. LLMs cannot generate true randomness."""
-    result = random.randint(min_val, max_val)
-    print(f"[TOOL] generate_random_number called with min={min_val}, max={max_val}, returning: {result}")
+    result = _RANDINT(min_val, max_val)
+    logger.debug("[TOOL] generate_random_number called with min=%s, max=%s, returning: %s", min_val, max_val, result)
     return result
 
 @tool
 def generate_uuid() -> str:
     """Generate a unique UUID. LLMs cannot generate true UUIDs."""
     result = str(uuid.uuid4())
-    print(f"[TOOL] generate_uuid called, returning: {result}")
+    logger.debug("[TOOL] generate_uuid called, returning: %s", result)
     return result
 
+# Supported hash algorithms, looked up once per call instead of an if/elif chain
+_HASH_CTORS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+}
+
 @tool
 def hash_string(text: str, algorithm: str = "sha256") -> str:
     """
     Hash a string using the specified algorithm (md5, sha1, sha256, sha512).
     LLMs cannot compute actual cryptographic hashes.
     """
-    text_bytes = text.encode('utf-8')
-    
-    if algorithm == "md5":
-        result = hashlib.md5(text_bytes).hexdigest()
-    elif algorithm == "sha1":
-        result = hashlib.sha1(text_bytes).hexdigest()
-    elif algorithm == "sha256":
-        result = hashlib.sha256(text_bytes).hexdigest()
-    elif algorithm == "sha512":
-        result = hashlib.sha512(text_bytes).hexdigest()
+    ctor = _HASH_CTORS.get(algorithm)
+    if ctor:
+        # Digests are informational only, so let OpenSSL use its fastest path
+        result = ctor(text.encode('utf-8'), usedforsecurity=False).hexdigest()
     else:
         result = f"Unsupported algorithm: {algorithm}. Use md5, sha1, sha256, or sha512."
     
-    print(f"[TOOL] hash_string called with text='{text}', algorithm='{algorithm}', returning: {result}")
+    logger.debug("[TOOL] hash_string called with text='%s', algorithm='%s', returning: %s", text, algorithm, result)
     return result
 
 @tool
@@ -62,17 +75,20 @@ def calculate_file_size(size_bytes: int) -> str:
     Returns exact conversions that require precise computation.
     """
     units = ['bytes', 'KB', 'MB', 'GB', 'TB', 'PB']
-    size = float(size_bytes)
-    unit_index = 0
-    
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
+    # Each unit is 2**10 larger, so the unit index follows from the bit length
+    if size_bytes <= 0:
+        unit_index = 0
+    else:
+        unit_index = min((size_bytes.bit_length() - 1) // 10, len(units) - 1)
+    size = size_bytes / (1 << (unit_index * 10))
     
     result = f"{round(size, 2)} {units[unit_index]}"
-    print(f"[TOOL] calculate_file_size called with {size_bytes} bytes, returning: {result}")
+    logger.debug("[TOOL] calculate_file_size called with %s bytes, returning: %s", size_bytes, result)
     return result
 
+# Indexed by date.weekday(), which is computed in C and needs no locale lookup
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
 @tool
 def get_day_of_week(year: int, month: int, day: int) -> str:
     """
@@ -81,32 +97,41 @@ def get_day_of_week(year: int, month: int, day: int) -> str:
     """
     try:
         date_obj = datetime.date(year, month, day)
-        day_name = date_obj.strftime("%A")
+        day_name = _DAY_NAMES[date_obj.weekday()]
         result = f"{year}-{month:02d}-{day:02d} was/is a {day_name}"
-        print(f"[TOOL] get_day_of_week called with {year}-{month}-{day}, returning: {result}")
+        logger.debug("[TOOL] get_day_of_week called with %s-%s-%s, returning: %s", year, month, day, result)
         return result
     except ValueError as e:
         error_msg = f"Invalid date: {str(e)}"
-        print(f"[TOOL] get_day_of_week error: {error_msg}")
+        logger.warning("[TOOL] get_day_of_week error: %s", error_msg)
         return error_msg
 
+def _parse_ymd(date_str):
+    """
+    Parse a zero-padded YYYY-MM-DD date. date.fromisoformat alone also accepts
+    other ISO forms on Python 3.11+ (e.g. 20200101, 2020-W01-1), so check the shape first.
+    """
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+        raise ValueError(f"date {date_str!r} does not match format YYYY-MM-DD")
+    return datetime.date.fromisoformat(date_str)
+
 @tool
 def calculate_days_between(start_date: str, end_date: str) -> str:
     """
-    Calculate exact number of days between two dates (format: YYYY-MM-DD).
+    Calculate exact number of days between two dates (format: YYYY-MM-DD, zero-padded).
     LLMs cannot accurately compute date differences.
     """
     try:
-        start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
+        start = _parse_ymd(start_date)
+        end = _parse_ymd(end_date)
         difference = end - start
         
         result = f"{difference.days} days (approximately {round(difference.days / 7, 2)} weeks or {round(difference.days / 365.25, 2)} years)"
-        print(f"[TOOL] calculate_days_between called with {start_date} to {end_date}, returning: {result}")
+        logger.debug("[TOOL] calculate_days_between called with %s to %s, returning: %s", start_date, end_date, result)
         return result
     except ValueError as e:
         error_msg = f"Invalid date format. Use YYYY-MM-DD. Error: {str(e)}"
-        print(f"[TOOL] calculate_days_between error: {error_msg}")
+        logger.warning("[TOOL] calculate_days_between error: %s", error_msg)
         return error_msg
 
 # Initialize the LLM
@@ -125,20 +150,11 @@ tools = [
     get_day_of_week,
     calculate_days_between
 ]
+TOOLS_BY_NAME = {t.name: t for t in tools}
 llm_with_tools = llm.bind_tools(tools)
 
-@app.entrypoint
-def invoke_agent(payload, context=None):
-    """
-    Entry point for the agent invocation
-    """
-    try:
-        user_input = payload.get("prompt", "Hello!")
-        print(f"[DEBUG] Received prompt: {user_input}")
-        
-        # Create initial messages with system message
-        messages = [
-            SystemMessage(content="""You are a helpful assistant with access to tools. 
+# The system prompt never changes, so build it once and reuse it for every request
+SYSTEM_MSG = SystemMessage(content="""You are a helpful assistant with access to tools. 
 You MUST use the available tools when asked about:
 - Current time/timestamp: use get_current_timestamp
 - Random numbers: use generate_random_number
@@ -148,65 +164,143 @@ You MUST use the available tools when asked about:
 - Day of week: use get_day_of_week
 - Date calculations: use calculate_days_between
 
-Always provide the tool result in your response."""),
-            HumanMessage(content=user_input)
-        ]
+Always provide the tool result in your response.""")
+
+# Prompt template built once; each request only fills in the conversation history
+PROMPT = ChatPromptTemplate.from_messages([SYSTEM_MSG, MessagesPlaceholder("history")])
+
+# Shared pool for running independent tool calls from one response concurrently
+tool_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+# Tools whose raw output is already the whole answer; a lone call to one of these
+# is returned directly instead of asking the LLM to restate it
+DIRECT_ANSWER_TOOLS = frozenset({"get_current_timestamp", "generate_uuid", "generate_random_number"})
+
+# Final answers for repeated prompts, keyed by prompt hash and evicted least-recently-used first
+RESPONSE_CACHE_SIZE = 1024
+_response_cache = collections.OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Tools whose output depends only on their arguments, so answers built from them can be reused
+CACHEABLE_TOOLS = frozenset({"hash_string", "calculate_file_size", "get_day_of_week", "calculate_days_between"})
+# Prompts mentioning any of these words need a fresh answer (whole words only, so
+# "know" or "sometimes" don't count)
+_UNCACHEABLE_KEYWORDS = re.compile(r"\b(?:time|timestamp|now|today|current|uuid|guid|random)s?\b")
+
+def _prompt_cache_key(user_input):
+    """Return the response cache key for a prompt, or None if its answer must not be reused."""
+    prompt = user_input.strip()
+    lowered = prompt.lower()
+    if _UNCACHEABLE_KEYWORDS.search(lowered):
+        return None
+    # Internal key only: BLAKE2b is fast on 64-bit hosts and the raw digest skips hex encoding
+    return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16, usedforsecurity=False).digest()
+
+def _cache_get(key):
+    with _response_cache_lock:
+        result = _response_cache.get(key)
+        if result is not None:
+            _response_cache.move_to_end(key)
+        return result
+
+def _cache_put(key, result):
+    with _response_cache_lock:
+        _response_cache[key] = result
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+@app.entrypoint
+def invoke_agent(payload, context=None):
+    """
+    Entry point for the agent invocation
+    """
+    try:
+        user_input = payload.get("prompt", "Hello!")
+        logger.debug("Received prompt: %s", user_input)
+        
+        # Serve repeated deterministic prompts without calling the LLM at all
+        cache_key = _prompt_cache_key(user_input)
+        if cache_key is not None:
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Returning cached response: %s", cached)
+                return {"result": cached}
+        
+        # Create initial messages with system message
+        messages = PROMPT.format_messages(history=[HumanMessage(content=user_input)])
         
         # First invocation - let the model decide if it needs tools
-        print("[DEBUG] Invoking LLM with tools...")
+        logger.debug("Invoking LLM with tools...")
         response = llm_with_tools.invoke(messages)
-        print(f"[DEBUG] LLM response received. Has tool_calls: {hasattr(response, 'tool_calls') and bool(response.tool_calls)}")
+        logger.debug("LLM response received. Has tool_calls: %s", hasattr(response, 'tool_calls') and bool(response.tool_calls))
         
         # Check if the model wants to use tools
         if hasattr(response, 'tool_calls') and response.tool_calls:
-            print(f"[DEBUG] Tool calls requested: {len(response.tool_calls)}")
+            logger.debug("Tool calls requested: %s", len(response.tool_calls))
             # Add the AI response to messages
             messages.append(response)
             
-            # Execute each tool call and add results
+            # Dispatch all tool calls concurrently; they are independent of each other
+            futures = []
             for i, tool_call in enumerate(response.tool_calls):
                 tool_name = tool_call["name"]
                 tool_args = tool_call["args"]
-                tool_call_id = tool_call.get("id", "")
-                
-                print(f"[DEBUG] Executing tool {i+1}: {tool_name} with args: {tool_args}")
                 
-                # Find and execute the tool
-                tool_result = None
-                for tool_func in tools:
-                    if tool_func.name == tool_name:
-                        tool_result = tool_func.invoke(tool_args)
-                        break
+                logger.debug("Executing tool %s: %s with args: %s", i + 1, tool_name, tool_args)
                 
-                if tool_result is None:
-                    tool_result = f"Tool {tool_name} not found"
-                    print(f"[ERROR] Tool not found: {tool_name}")
+                tool_func = TOOLS_BY_NAME.get(tool_name)
+                future = tool_executor.submit(tool_func.invoke, tool_args) if tool_func else None
+                futures.append((tool_call, future))
+            
+            # Collect results in the original order and add them as ToolMessages
+            for tool_call, future in futures:
+                if future is not None:
+                    tool_result = future.result()
+                else:
+                    tool_result = f"Tool {tool_call['name']} not found"
+                    logger.error("Tool not found: %s", tool_call['name'])
                 
-                print(f"[DEBUG] Tool result: {tool_result}")
+                logger.debug("Tool result: %s", tool_result)
                 
                 # Add tool result as a ToolMessage
                 messages.append(
                     ToolMessage(
                         content=str(tool_result),
-                        tool_call_id=tool_call_id
+                        tool_call_id=tool_call.get("id", "")
                     )
                 )
             
+            # A single simple tool call needs no second LLM round-trip to phrase the answer
+            if (len(response.tool_calls) == 1
+                    and response.tool_calls[0]["name"] in DIRECT_ANSWER_TOOLS
+                    and not response.content):
+                # The only ToolMessage, appended last above
+                direct_result = messages[-1].content
+                logger.debug("Returning tool result directly: %s", direct_result)
+                return {"result": direct_result}
+            
             # Use llm_with_tools for the final response
-            print("[DEBUG] Getting final response from LLM...")
+            logger.debug("Getting final response from LLM...")
             final_response = llm_with_tools.invoke(messages)
-            print(f"[DEBUG] Final response content: {final_response.content}")
+            logger.debug("Final response content: %s", final_response.content)
+            # Only answers built entirely from deterministic tools are reused
+            if cache_key is not None and all(tc["name"] in CACHEABLE_TOOLS for tc in response.tool_calls):
+                _cache_put(cache_key, final_response.content)
             return {"result": final_response.content}
         else:
             # No tools needed, return direct response
-            print(f"[DEBUG] No tools used. Direct response: {response.content}")
+            logger.debug("No tools used. Direct response: %s", response.content)
             return {"result": response.content}
             
     except Exception as e:
-        print(f"[ERROR] Exception in invoke_agent: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Exception in invoke_agent: %s", e)
         return {"result": f"Error: {str(e)}"}
 
 if __name__ == "__main__":
+    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    logging.basicConfig(level=log_level)
+    # basicConfig is a no-op if the root logger already has a handler (e.g. one added by
+    # opentelemetry-instrument), so set the level on this module's logger as well
+    logger.setLevel(log_level)
     app.run()
@@ -1,13 +1,42 @@
 import boto3
-import json
+from botocore.config import Config
+import orjson
 import uuid
 import time
+import concurrent.futures
 
 # Replace with your actual Agent ARN
 agent_arn = "arn:aws:bedrock-agentcore:us-east-1:123456789012:runtime/langchain-agent-abc123"
 
-# Initialize the Bedrock AgentCore client
-agentcore_client = boto3.client('bedrock-agentcore', region_name='us-east-1')
+# Initialize the Bedrock AgentCore client, keeping connections pooled across calls
+agentcore_client = boto3.client(
+    'bedrock-agentcore',
+    region_name='us-east-1',
+    config=Config(
+        max_pool_connections=16,
+        retries={'mode': 'adaptive', 'total_max_attempts': 3}
+    )
+)
+
+# Reuse one runtime session for the whole run so the agent stays warm between calls
+SESSION_ID = str(uuid.uuid4())
+
+def invoke_once(payload):
+    """Invoke the agent with a pre-encoded JSON payload and return its result text."""
+    response = agentcore_client.invoke_agent_runtime(
+        agentRuntimeArn=agent_arn,
+        runtimeSessionId=SESSION_ID,
+        payload=payload,
+        qualifier="DEFAULT"
+    )
+    
+    # Process the response; orjson.loads accepts the raw bytes directly
+    buf = bytearray()
+    for chunk in response.get("response", []):
+        buf.extend(chunk)
+    
+    result = orjson.loads(buf)
+    return result['result']
 
 # Test prompts that prove the tools are being used (LLMs cannot do these)
 test_prompts = [
@@ -20,6 +49,10 @@ test_prompts = [
     "How many days between 2020-01-01 and 2025-12-31?",
 ]
 
+# The prompts are fixed, so encode their payloads once up front
+PAYLOADS = [orjson.dumps({"prompt": p}) for p in test_prompts]
+TIMESTAMP_PAYLOAD = orjson.dumps({"prompt": "What is the current timestamp?"})
+
 print("="*80)
 print("Testing LangChain Agent with Tools on Amazon Bedrock AgentCore Runtime")
 print("="*80)
@@ -31,37 +64,23 @@ print("- Cryptographic hashes (LLM cannot compute actual hashes)")
 print("- Date calculations (LLM cannot accurately compute date arithmetic)")
 print("="*80)
 
-for i, prompt in enumerate(test_prompts, 1):
-    print(f"\n{'='*80}")
-    print(f"Test {i}/{len(test_prompts)}: {prompt}")
-    print(f"{'='*80}")
-    
-    # Prepare the payload
-    payload = json.dumps({"prompt": prompt}).encode()
+# Fire all test prompts at once; each call is I/O-bound so they overlap fully
+with concurrent.futures.ThreadPoolExecutor(max_workers=len(test_prompts)) as executor:
+    futures = {
+        executor.submit(invoke_once, PAYLOADS[i-1]): (i, prompt)
+        for i, prompt in enumerate(test_prompts, 1)
+    }
     
-    try:
-        # Invoke the agent
-        response = agentcore_client.invoke_agent_runtime(
-            agentRuntimeArn=agent_arn,
-            runtimeSessionId=str(uuid.uuid4()),
-            payload=payload,
-            qualifier="DEFAULT"
-        )
+    for future in concurrent.futures.as_completed(futures):
+        i, prompt = futures[future]
+        print(f"\n{'='*80}")
+        print(f"Test {i}/{len(test_prompts)}: {prompt}")
+        print(f"{'='*80}")
         
-        # Process the response
-        content = []
-        for chunk in response.get("response", []):
-            content.append(chunk.decode('utf-8'))
-        
-        result = json.loads(''.join(content))
-        print(f"Result: {result['result']}")
-        
-    except Exception as e:
-        print(f"Error: {str(e)}")
-    
-    # Small delay between requests
-    if i < len(test_prompts):
-        time.sleep(1)
+        try:
+            print(f"Result: {future.result()}")
+        except Exception as e:
+            print(f"Error: {str(e)}")
 
 print("\n" + "="*80)
 print("Testing Complete!")
@@ -74,22 +93,10 @@ print("="*80)
 
 for attempt in [1, 2]:
     print(f"\nAttempt {attempt}:")
-    payload = json.dumps({"prompt": "What is the current timestamp?"}).encode()
     
     try:
-        response = agentcore_client.invoke_agent_runtime(
-            agentRuntimeArn=agent_arn,
-            runtimeSessionId=str(uuid.uuid4()),
-            payload=payload,
-            qualifier="DEFAULT"
-        )
-        
-        content = []
-        for chunk in response.get("response", []):
-            content.append(chunk.decode('utf-8'))
-        
-        result = json.loads(''.join(content))
-        print(f"  Timestamp: {result['result']}")
+        result = invoke_once(TIMESTAMP_PAYLOAD)
+        print(f"  Timestamp: {result}")
         
         if attempt == 1:
             print("  Waiting 3 seconds...")